@@ -15,8 +15,7 @@ passphrase = os.getenv("PASSPHRASE")
 local_files = [
     "neo4j_data/Disease.csv",
     "neo4j_data/Molecule.csv", 
-    "neo4j_data/Targets.csv",
-    "neo4j_data/Relationships.csv"
+    "neo4j_data/Targets.csv"
 ]
 
 # Remote paths
@@ -32,6 +31,14 @@ def read_import_command(script_path="neo4j_txt_command.txt"):
         print(f"Error: Command file {script_path} not found. Make sure to run construct_KG.py first.")
         return None
 
+# Get the local relationship files referenced by the import command
+def get_relationship_files(import_command, local_dir="neo4j_data/"):
+    return [
+        local_dir + os.path.basename(arg.split("=", 1)[1])
+        for arg in import_command.split()
+        if arg.startswith("--relationships=")
+    ]
+
 # Establish SSH connection with key authentication
 def connect_ssh(hostname, port, username, key_path, passphrase):
     ssh = paramiko.SSHClient()
@@ -76,7 +83,7 @@ if __name__ == "__main__":
         
         # Upload CSV files to remote server
         print("Uploading files...")
-        upload_files(sftp, local_files, remote_import_dir)
+        upload_files(sftp, local_files + get_relationship_files(import_command), remote_import_dir)
         
         # Execute the import command
         print(f"Executing: {import_command}")
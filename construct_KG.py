@@ -2,6 +2,7 @@ from knowledge_graph_adapters.disease_adapter import create_disease_data
 from knowledge_graph_adapters.evidence_adapter import create_evidence_data
 from knowledge_graph_adapters.molecule_adapter import create_molecule_data
 from knowledge_graph_adapters.targets_adapter import create_targets_data
+from knowledge_graph_adapters.association_adapter import create_association_data, create_association_evidence_data
 from knowledge_graph_adapters.config_loader import load_config
 import pandas as pd
 import glob
@@ -128,6 +129,22 @@ if __name__ == "__main__":
         node_files = [f"import/{node}.csv" for node in ["Disease", "Molecule", "Targets"]]
             
         relationship_files = ["import/Relationships.csv"]
+        
+        # Aggregate association scores from evidence of all configured sources
+        association_df = None
+        if config["association"]["enabled"]:
+            association_evidence = create_association_evidence_data(data_path + "evidence/")
+            if association_evidence is not None:
+                association_df = create_association_data(association_evidence, nodes)
+        
+        if association_df is not None:
+            association_df.to_csv(save_path + "Associations.csv", sep=",", index=False)
+            relationship_files.append("import/Associations.csv")
+            print(f"Created Association Dataframe: {association_df.shape}")
+        elif os.path.exists(save_path + "Associations.csv"):
+            # Remove associations from a previous run so they are not uploaded
+            os.remove(save_path + "Associations.csv")
+            
         write_bash_script(node_files, relationship_files, "neo4j_txt_command.txt")
         print("Created Bash Script")
     else:
@@ -0,0 +1,113 @@
+import pandas as pd
+import numpy as np
+import os
+from knowledge_graph_adapters.config_loader import get_adapter_config
+from knowledge_graph_adapters.evidence_adapter import construct_dataframe
+
+def harmonic_sum(dataframe, group_keys, score_col, max_evidence):
+    """
+    Compute the normalised harmonic sum of scores within each group
+
+    Scores are ranked in descending order within each group and the i-th score
+    is weighted by 1 / i^2. The sum is divided by the maximum theoretical
+    harmonic sum (all scores equal to 1) so that results lie in [0, 1].
+
+    Args:
+        dataframe (pd.DataFrame): DataFrame with group keys and scores
+        group_keys (list): Columns to group by
+        score_col (str): Column holding the scores to aggregate
+        max_evidence (int): Maximum number of ranked scores per group to include
+
+    Returns:
+        pd.Series: Normalised harmonic sum indexed by the group keys
+    """
+    ranked_df = dataframe.sort_values(group_keys + [score_col], ascending=[True] * len(group_keys) + [False])
+    rank = ranked_df.groupby(group_keys, sort=False).cumcount() + 1
+    ranked_df = ranked_df[rank <= max_evidence]
+    rank = rank[rank <= max_evidence]
+
+    # Weight each score by its rank and sum within each group
+    weighted = ranked_df[score_col] / rank.astype(float) ** 2
+    max_theoretical = np.sum(1.0 / np.arange(1, max_evidence + 1, dtype=float) ** 2)
+    return weighted.groupby([ranked_df[key] for key in group_keys]).sum() / max_theoretical
+
+def create_association_evidence_data(evidence_folder):
+    """
+    Load disease to target evidence scores from all configured evidence sources
+
+    Only the fields needed for association scores are read from each source.
+
+    Args:
+        evidence_folder (str): Path to the evidence folder
+
+    Returns:
+        pd.DataFrame: DataFrame with :START_ID, :END_ID, datasourceId and score, or None
+    """
+    config = get_adapter_config("evidence")
+    keys = ["datasourceId", "targetId", "diseaseId", "score"]
+
+    list_of_data = []
+    for folder in config["folder_keys"]:
+        sub_folder_path = f"{evidence_folder}sourceid={folder}/"
+        if not os.path.exists(sub_folder_path):
+            continue
+
+        raw_df = construct_dataframe(sub_folder_path, keys)
+        if not raw_df.empty:
+            list_of_data.append(raw_df)
+
+    if not list_of_data:
+        return None
+
+    evidence_df = pd.concat(list_of_data, axis=0, ignore_index=True)
+    evidence_df = evidence_df.rename(columns={'diseaseId': ':START_ID', 'targetId': ':END_ID'})
+    return evidence_df[[':START_ID', ':END_ID', 'datasourceId', 'score']]
+
+def create_association_data(evidence_df, nodes):
+    """
+    Aggregate disease to target evidence into association relationships
+
+    Per-datasource scores are the harmonic sum of the top max_evidence evidence
+    scores for a (disease, target, datasource) triple, normalised by the maximum
+    theoretical harmonic sum. The overall score is the normalised harmonic sum
+    of the weighted per-datasource scores for a (disease, target) pair.
+
+    Args:
+        evidence_df (pd.DataFrame): DataFrame from create_association_evidence_data
+        nodes (set): Set of node IDs
+
+    Returns:
+        pd.DataFrame: DataFrame with one Association relationship per pair, or None
+    """
+    config = get_adapter_config("association")
+    weights = config["datasource_weights"]
+    max_evidence = config["max_evidence"]
+
+    # Only evidence between existing nodes contributes
+    evidence_df = evidence_df[evidence_df[':START_ID'].isin(nodes) & evidence_df[':END_ID'].isin(nodes)].copy()
+
+    # Scores of "No record" are dropped
+    evidence_df['score'] = pd.to_numeric(evidence_df['score'], errors='coerce')
+    evidence_df = evidence_df.dropna(subset=['score'])
+    if evidence_df.empty:
+        return None
+
+    # Per-datasource association scores
+    pair_keys = [':START_ID', ':END_ID']
+    datasource_scores = harmonic_sum(evidence_df, pair_keys + ['datasourceId'], 'score', max_evidence).rename('score').reset_index()
+
+    # Overall association scores from weighted per-datasource scores
+    datasource_scores['weighted_score'] = datasource_scores['score'] * datasource_scores['datasourceId'].map(weights).fillna(1.0)
+    overall_scores = harmonic_sum(datasource_scores, pair_keys, 'weighted_score', max_evidence).rename('score:float')
+    evidence_counts = evidence_df.groupby(pair_keys).size().rename('evidenceCount:int')
+
+    # One column per datasource, left empty where a pair has no evidence from it
+    wide_scores = datasource_scores.pivot(index=pair_keys, columns='datasourceId', values='score')
+    wide_scores.columns = [f"{datasource}_score:float" for datasource in wide_scores.columns]
+
+    association_df = pd.concat([overall_scores, evidence_counts, wide_scores], axis=1).reset_index()
+    association_df[':TYPE'] = "Association"
+
+    # Reorder columns
+    middle_cols = [col for col in association_df.columns if col not in [':START_ID', ':END_ID', ':TYPE']]
+    return association_df[[':START_ID'] + middle_cols + [':END_ID', ':TYPE']]
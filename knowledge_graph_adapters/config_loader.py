@@ -20,7 +20,7 @@ def get_adapter_config(adapter_type):
     Get configuration for a specific adapter type
     
     Args:
-        adapter_type (str): Type of adapter (disease, targets, molecule, evidence)
+        adapter_type (str): Type of adapter (disease, targets, molecule, evidence, association)
         
     Returns:
         dict: Configuration for the specified adapter